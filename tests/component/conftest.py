@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 
 # See https://developer.skao.int/projects/ska-ser-xray/en/latest/guide/pytest.html
@@ -10,3 +11,13 @@ def pytest_collection_modifyitems(
         for marker in item.iter_markers(name="xray"):
             test_key = marker.args[0]
             item.user_properties.append(("test_key", test_key))
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """
+    A requests Session shared by all the component tests, so the connection
+    to the deployed service is kept alive and reused between requests
+    """
+    with requests.Session() as session:
+        yield session
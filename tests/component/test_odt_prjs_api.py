@@ -5,13 +5,9 @@ These will run from a test pod inside a kubernetes cluster, making requests
 to a deployment of ska-oso-ost-services in the same cluster
 """
 
-import json
-
 # pylint: disable=missing-timeout
 from http import HTTPStatus
 
-import requests
-
 from ..unit.util import (
     VALID_PROJECT_WITHOUT_JSON,
     TestDataFactory,
@@ -20,40 +16,39 @@ from ..unit.util import (
 from . import ODT_URL
 
 
-def test_sbd_created_and_linked_to_project():
+def test_sbd_created_and_linked_to_project(http_session):
     """
     Test that an entity sent to POST /prjs creates an empty project, then a request
     to POST /prjs/<prj_id>/<obs_block_id>/sbds adds an SBDefinition to that Project
     """
     # Create an empty Project
-    prj_post_response = requests.post(
+    prj_post_response = http_session.post(
         f"{ODT_URL}/prjs",
-        data=json.dumps({"telescope": "ska_mid"}),
-        headers={"Content-type": "application/json"},
+        json={"telescope": "ska_mid"},
     )
 
     assert prj_post_response.status_code == HTTPStatus.OK, prj_post_response.content
     prj_id = prj_post_response.json()["prj_id"]
 
     # Create an SBDefinition in that Project in the first observing block
-    sbd_post_response = requests.post(
+    sbd_post_response = http_session.post(
         f"{ODT_URL}/prjs/{prj_id}/ob-1/sbds",
     )
     assert sbd_post_response.status_code == HTTPStatus.OK
     sbd_id = sbd_post_response.json()["sbd"]["sbd_id"]
 
     # Check the SBDefinition is linked to Project
-    get_prj_response = requests.get(f"{ODT_URL}/prjs/{prj_id}")
+    get_prj_response = http_session.get(f"{ODT_URL}/prjs/{prj_id}")
     assert get_prj_response.status_code == HTTPStatus.OK
     assert get_prj_response.json()["obs_blocks"][0]["sbd_ids"][0] == sbd_id
 
 
-def test_prj_post_then_get():
+def test_prj_post_then_get(http_session):
     """
     Test that an entity sent to POST /prjs can then be retrieved
     with GET /prjs/{identifier}
     """
-    post_response = requests.post(
+    post_response = http_session.post(
         f"{ODT_URL}/prjs",
         data=VALID_PROJECT_WITHOUT_JSON,
         headers={"Content-type": "application/json"},
@@ -67,7 +62,7 @@ def test_prj_post_then_get():
     )
 
     prj_id = post_response.json()["prj_id"]
-    get_response = requests.get(f"{ODT_URL}/prjs/{prj_id}")
+    get_response = http_session.get(f"{ODT_URL}/prjs/{prj_id}")
 
     # Assert the ODT can get the Project, ignoring the metadata as it contains
     # timestamps and is the responsibility of the ODA
@@ -79,12 +74,12 @@ def test_prj_post_then_get():
     )
 
 
-def test_prj_post_then_put():
+def test_prj_post_then_put(http_session):
     """
     Test that an entity sent to POST /prjs can then be
     updated with PUT /prjs/{identifier}
     """
-    post_response = requests.post(
+    post_response = http_session.post(
         f"{ODT_URL}/prjs",
         data=VALID_PROJECT_WITHOUT_JSON,
         headers={"Content-type": "application/json"},
@@ -99,7 +94,7 @@ def test_prj_post_then_put():
 
     prj_id = post_response.json()["prj_id"]
     prj_to_update = TestDataFactory.project(prj_id=prj_id).model_dump_json()
-    put_response = requests.put(
+    put_response = http_session.put(
         f"{ODT_URL}/prjs/{prj_id}",
         data=prj_to_update,
         headers={"Content-type": "application/json"},
@@ -115,13 +110,13 @@ def test_prj_post_then_put():
     assert put_response.json()["metadata"]["version"] == 2
 
 
-def test_prj_get_not_found():
+def test_prj_get_not_found(http_session):
     """
     Test that the GET /prjs/{identifier} path returns
     404 when the Project is not found in the ODA
     """
 
-    response = requests.get(f"{ODT_URL}/prjs/123")
+    response = http_session.get(f"{ODT_URL}/prjs/123")
 
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert response.json() == {
@@ -129,13 +124,17 @@ def test_prj_get_not_found():
     }
 
 
-def test_prj_put_not_found():
+def test_prj_put_not_found(http_session):
     """
-    Test that the GET /prjs/{identifier} path returns
+    Test that the PUT /prjs/{identifier} path returns
     404 when the Project is not found in the ODA
     """
 
-    response = requests.get(f"{ODT_URL}/prjs/123")
+    response = http_session.put(
+        f"{ODT_URL}/prjs/123",
+        data=TestDataFactory.project(prj_id="123").model_dump_json(),
+        headers={"Content-type": "application/json"},
+    )
 
     assert response.status_code == HTTPStatus.NOT_FOUND
     assert response.json() == {
@@ -2,19 +2,22 @@
 pytest fixtures to be used by unit tests
 """
 
-from importlib.metadata import version
+from unittest import mock
 
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from ska_oso_services import create_app
+from ska_oso_services.app import API_PREFIX
+from ska_oso_services.common import oda
+from tests.unit.util import bind_uow
 
-OSO_SERVICES_MAJOR_VERSION = version("ska-oso-services").split(".")[0]
-ODT_BASE_API_URL = f"/ska-oso-services/oso/api/v{OSO_SERVICES_MAJOR_VERSION}/odt"
+ODT_BASE_API_URL = f"{API_PREFIX}/odt"
+JSON_HEADERS = {"Content-type": "application/json"}
 
 
-@pytest.fixture(name="test_app")
+@pytest.fixture(scope="session", name="test_app")
 def test_app_fixture() -> FastAPI:
     """
     Fixture to configure a test app instance
@@ -22,9 +25,50 @@ def test_app_fixture() -> FastAPI:
     return create_app(production=False)
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def client(test_app: FastAPI) -> TestClient:
     """
-    Create a test client from the app instance, without running a live server
+    Create a test client from the app instance, without running a live server.
+
+    The client is shared by the whole session (so once per worker under
+    pytest-xdist) and entered as a context manager, so the app startup only
+    runs once. The ODA is mocked per test, so no state is carried between
+    requests.
+    """
+    with TestClient(test_app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session", name="_patched_oda_uow")
+def patched_oda_uow_fixture():
+    """
+    Patch the ODA unit of work once for the whole session rather than for
+    every test. No test relies on the signature of oda.uow, so it is not
+    autospecced.
+
+    The ODA context is shared by all the ODT API modules, so patching it here
+    covers both the sbds and prjs endpoints.
+    """
+    patcher = mock.patch.object(oda, "uow")
+    yield patcher.start()
+    patcher.stop()
+
+
+@pytest.fixture(autouse=True)
+def mock_oda(_patched_oda_uow):
+    """
+    Reset the session-wide oda.uow mock so no configuration or call history
+    leaks between tests
+    """
+    _patched_oda_uow.reset_mock()
+    _patched_oda_uow.side_effect = None
+    _patched_oda_uow.return_value = mock.MagicMock()
+    return _patched_oda_uow
+
+
+@pytest.fixture()
+def uow_mock(mock_oda):
+    """
+    The UnitOfWork mock that `with oda.uow() as uow:` yields in the API code
     """
-    return TestClient(test_app)
+    return bind_uow(mock_oda)
@@ -2,44 +2,43 @@
 Unit tests for ska_oso_services.api
 """
 
-import json
 from http import HTTPStatus
-from unittest import mock
 
 import pytest
 from ska_oso_pdm.project import ObservingBlock
 
-from tests.unit.util import TestDataFactory, assert_json_is_equal
+from tests.unit.util import (
+    VALID_PROJECT_JSON,
+    VALID_PROJECT_WITHOUT_JSON,
+    TestDataFactory,
+    assert_json_is_equal,
+)
 
-from .conftest import ODT_BASE_API_URL
+from .conftest import JSON_HEADERS, ODT_BASE_API_URL
 
 PRJS_API_URL = f"{ODT_BASE_API_URL}/prjs"
+MINIMAL_PROJECT_JSON = b'{"telescope": "ska_mid"}'
+MINIMAL_PROJECT_WITH_ID_JSON = b'{"prj_id": "prj-1234", "telescope": "ska_mid"}'
 
 
 class TestProjectGet:
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_get_existing_prj(self, mock_uow, client):
+    def test_prjs_get_existing_prj(self, uow_mock, client):
         """
         Check the prjs_get method returns the expected Project and status code
         """
-        uow_mock = mock.MagicMock()
         project = TestDataFactory.project()
         uow_mock.prjs.get.return_value = project
-        mock_uow().__enter__.return_value = uow_mock
 
         result = client.get(f"{PRJS_API_URL}/prj-1234")
 
-        assert_json_is_equal(result.text, project.model_dump_json())
+        assert_json_is_equal(result.content, VALID_PROJECT_JSON)
         assert result.status_code == HTTPStatus.OK
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_get_not_found_prj(self, mock_uow, client):
+    def test_prjs_get_not_found_prj(self, uow_mock, client):
         """
         Check the prjs_get method returns the Not Found error when identifier not in ODA
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.get.side_effect = KeyError("could not be found")
-        mock_uow().__enter__.return_value = uow_mock
 
         result = client.get(f"{PRJS_API_URL}/prj-1234")
         assert result.json() == {
@@ -47,15 +46,12 @@ class TestProjectGet:
         }
         assert result.status_code == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_get_error(self, mock_uow, client):
+    def test_prjs_get_error(self, uow_mock, client):
         """
         Check the prjs_get method returns a formatted error
         when ODA responds with an error
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.get.side_effect = ValueError("Something bad!")
-        mock_uow().__enter__.return_value = uow_mock
 
         # Middleware re-raises exceptions to make visible to tests and servers:
         # https://github.com/encode/starlette/blob/master/starlette/middleware/errors.py#L186
@@ -70,51 +66,45 @@ class TestProjectGet:
 
 
 class TestProjectPost:
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_success(self, mock_uow, client):
+    def test_prjs_post_success(self, uow_mock, client):
         """
         Check the prjs_post method returns the expected response
         """
-        uow_mock = mock.MagicMock()
         created_project = TestDataFactory.project()
         uow_mock.prjs.add.return_value = created_project
         uow_mock.prjs.get.return_value = created_project
-        mock_uow().__enter__.return_value = uow_mock
 
         result = client.post(
             f"{PRJS_API_URL}",
-            data=TestDataFactory.project(prj_id=None).model_dump_json(),
-            headers={"Content-type": "application/json"},
+            content=VALID_PROJECT_WITHOUT_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert result.status_code == HTTPStatus.OK
-        assert_json_is_equal(result.text, created_project.model_dump_json())
+        assert_json_is_equal(result.content, VALID_PROJECT_JSON)
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_with_minimum_body(self, mock_uow, client):
+    def test_prjs_post_with_minimum_body(self, uow_mock, client):
         """
         Check the prjs_post method returns an 'empty' project with a
         single observing block if a request body with only the valid fields is sent
         """
-        uow_mock = mock.MagicMock()
         created_project = TestDataFactory.project()
         uow_mock.prjs.add.return_value = created_project
         uow_mock.prjs.get.return_value = created_project
-        mock_uow().__enter__.return_value = uow_mock
 
         result = client.post(
             f"{PRJS_API_URL}",
-            data=json.dumps({"telescope": "ska_mid"}),
-            headers={"Content-type": "application/json"},
+            content=MINIMAL_PROJECT_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert result.status_code == HTTPStatus.OK
-        assert_json_is_equal(result.text, created_project.model_dump_json())
+        assert_json_is_equal(result.content, VALID_PROJECT_JSON)
         # Check that the persisted value has an empty observing block
         args, _ = uow_mock.prjs.add.call_args
         assert len(args[0].obs_blocks) == 1
 
-    def test_prjs_post_given_prj_id_raises_error(self, client):
+    def test_prjs_post_given_prj_id_raises_error(self, mock_oda, client):
         """
         Check the prjs_post method returns a validation error if the user
         gives a prj_id in the body, as we don't want to just silently overwrite this
@@ -122,8 +112,8 @@ class TestProjectPost:
 
         result = client.post(
             f"{PRJS_API_URL}",
-            data=TestDataFactory.project().model_dump_json(),
-            headers={"Content-type": "application/json"},
+            content=VALID_PROJECT_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert result.status_code == HTTPStatus.BAD_REQUEST
@@ -135,6 +125,8 @@ class TestProjectPost:
                 " should not be given in this request."
             )
         }
+        # The request is rejected before the ODA is used
+        mock_oda.assert_not_called()
 
     # TODO validate sbd_ids exist?
     # TODO extract to service layer
@@ -158,23 +150,20 @@ class TestProjectPost:
     #     }
     #     assert result.status_code == HTTPStatus.BAD_REQUEST
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_oda_error(self, mock_uow, client):
+    def test_prjs_post_oda_error(self, uow_mock, client):
         """
         Check the prjs_post method returns the expected error response
         from an error in the ODA
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.add.side_effect = IOError("test error")
-        mock_uow().__enter__.return_value = uow_mock
 
         # Middleware re-raises exceptions to make visible to tests and servers:
         # https://github.com/encode/starlette/blob/master/starlette/middleware/errors.py#L186
         with pytest.raises(IOError):
             response = client.post(
                 f"{PRJS_API_URL}",
-                data=TestDataFactory.project(prj_id=None).model_dump_json(),
-                headers={"Content-type": "application/json"},
+                content=VALID_PROJECT_WITHOUT_JSON,
+                headers=JSON_HEADERS,
             )
             result = response.json()
 
@@ -185,36 +174,35 @@ class TestProjectPost:
 
 
 class TestProjectPut:
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_put_success(self, mock_uow, client):
+    def test_prjs_put_success(self, uow_mock, client):
         """
         Check the prjs_put method returns the expected response
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.__contains__.return_value = True
         project = TestDataFactory.project()
         uow_mock.prjs.add.return_value = project
         uow_mock.prjs.get.return_value = project
-        mock_uow().__enter__.return_value = uow_mock
 
         result = client.put(
             f"{PRJS_API_URL}/{project.prj_id}",
-            data=project.model_dump_json(),
-            headers={"Content-type": "application/json"},
+            content=VALID_PROJECT_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert result.status_code == HTTPStatus.OK
-        assert_json_is_equal(result.text, project.model_dump_json())
+        assert_json_is_equal(result.content, VALID_PROJECT_JSON)
 
-    def test_prjs_put_wrong_identifier(self, client):
+    def test_prjs_put_wrong_identifier(self, mock_oda, client):
         """
         Check the prjs_put method returns the expected error response
         when the identifier in the path doesn't match the prj_id in the SBDefinition
         """
+        # The identifier check happens before the ODA is used, so the smallest
+        # valid Project with a prj_id is enough to exercise it
         result = client.put(
             f"{PRJS_API_URL}/00000",
-            data=TestDataFactory.project().model_dump_json(),
-            headers={"Content-type": "application/json"},
+            content=MINIMAL_PROJECT_WITH_ID_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert (
@@ -224,6 +212,7 @@ class TestProjectPut:
         )
 
         assert result.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        mock_oda.assert_not_called()
 
     # TODO currently no prj validation
     # @mock.patch("ska_oso_services.odt.api.prjs.validate_prj")
@@ -246,44 +235,38 @@ class TestProjectPut:
     #         "messages": {"validation_errors": "some validation error"},
     #     }}
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_put_not_found(self, mock_uow, client):
+    def test_prjs_put_not_found(self, uow_mock, client):
         """
         Check the prjs_put method returns the expected error response
         when the identifier is not found in the ODA.
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.__contains__.return_value = False
-        mock_uow().__enter__.return_value = uow_mock
 
         project = TestDataFactory.project(prj_id="prj-999")
         resp = client.put(
             f"{PRJS_API_URL}/{project.prj_id}",
-            data=project.model_dump_json(),
-            headers={"Content-type": "application/json"},
+            content=project.model_dump_json(),
+            headers=JSON_HEADERS,
         )
 
         assert resp.status_code == HTTPStatus.NOT_FOUND
         assert resp.json()["detail"] == "Identifier prj-999 not found in repository"
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_put_oda_error(self, mock_uow, client):
+    def test_prjs_put_oda_error(self, uow_mock, client):
         """
         Check the prjs_put method returns the expected error response
         from an error in the ODA
         """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.__contains__.return_value = True
         uow_mock.prjs.add.side_effect = IOError("test error")
-        mock_uow().__enter__.return_value = uow_mock
 
         project = TestDataFactory.project()
 
         with pytest.raises(IOError):
             resp = client.put(
                 f"{PRJS_API_URL}/{project.prj_id}",
-                data=project.model_dump_json(),
-                headers={"Content-type": "application/json"},
+                content=VALID_PROJECT_JSON,
+                headers=JSON_HEADERS,
             )
             result = resp.json()["detail"]
 
@@ -294,12 +277,9 @@ class TestProjectPut:
 
 
 class TestProjectAddSBDefinition:
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_sbd_prj_id_not_found(self, mock_uow, client):
+    def test_prjs_post_sbd_prj_id_not_found(self, uow_mock, client):
         """ """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.get.side_effect = KeyError("could not be found")
-        mock_uow().__enter__.return_value = uow_mock
 
         resp = client.post(
             f"{PRJS_API_URL}/prj-999/ob-1/sbds",
@@ -308,13 +288,10 @@ class TestProjectAddSBDefinition:
         assert resp.status_code == HTTPStatus.NOT_FOUND
         assert resp.json()["detail"] == "Identifier prj-999 not found in repository"
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_sbd_obs_block_id_not_found(self, mock_uow, client):
-        uow_mock = mock.MagicMock()
+    def test_prjs_post_sbd_obs_block_id_not_found(self, uow_mock, client):
         project = TestDataFactory.project()
         project.obs_blocks = []
         uow_mock.prjs.get.return_value = project
-        mock_uow().__enter__.return_value = uow_mock
 
         resp = client.post(
             f"{PRJS_API_URL}/{project.prj_id}/ob-1/sbds",
@@ -323,12 +300,9 @@ class TestProjectAddSBDefinition:
         assert resp.status_code == HTTPStatus.NOT_FOUND
         assert resp.json()["detail"] == "Observing Block 'ob-1' not found in Project"
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_sbd_oda_error(self, mock_uow, client):
+    def test_prjs_post_sbd_oda_error(self, uow_mock, client):
         """ """
-        uow_mock = mock.MagicMock()
         uow_mock.prjs.get.side_effect = IOError("test error")
-        mock_uow().__enter__.return_value = uow_mock
 
         with pytest.raises(IOError):
             resp = client.post(
@@ -338,9 +312,7 @@ class TestProjectAddSBDefinition:
             assert resp.json()["detail"] == "OSError('test error')"
             assert resp.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
-    @mock.patch("ska_oso_services.odt.api.prjs.oda.uow")
-    def test_prjs_post_sbd_success(self, mock_uow, client):
-        uow_mock = mock.MagicMock()
+    def test_prjs_post_sbd_success(self, uow_mock, client):
         project = TestDataFactory.project()
         obs_block_id = "ob-1"
         project.obs_blocks = [ObservingBlock(obs_block_id=obs_block_id)]
@@ -348,7 +320,6 @@ class TestProjectAddSBDefinition:
         uow_mock.prjs.get.return_value = project
         uow_mock.sbds.add.return_value = sbd
         uow_mock.prjs.add.return_value = project
-        mock_uow().__enter__.return_value = uow_mock
 
         resp = client.post(
             f"{PRJS_API_URL}/{project.prj_id}/{obs_block_id}/sbds",
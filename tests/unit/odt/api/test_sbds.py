@@ -15,14 +15,39 @@ from tests.unit.util import (
     assert_json_is_equal,
 )
 
-from .conftest import ODT_BASE_API_URL
+from .conftest import JSON_HEADERS, ODT_BASE_API_URL
 
 SBDS_API_URL = f"{ODT_BASE_API_URL}/sbds"
+# The sbd_id of VALID_MID_SBDEFINITION_JSON, and the URL to PUT it to
+SBD_ID = "sbd-mvp01-20200325-00001"
+SBD_API_URL = f"{SBDS_API_URL}/{SBD_ID}"
+
+VALIDATION_ERRORS = {"validation_errors": "some validation error"}
+VALIDATION_FAILED_RESPONSE = {"detail": {"valid": False, "messages": VALIDATION_ERRORS}}
+
+# The POST and PUT requests that validate then write an SBDefinition
+SBDS_WRITE_REQUESTS = pytest.mark.parametrize(
+    "method,url,body",
+    [
+        ("POST", SBDS_API_URL, SBDEFINITION_WITHOUT_ID_JSON),
+        ("PUT", SBD_API_URL, VALID_MID_SBDEFINITION_JSON),
+    ],
+    ids=["post", "put"],
+)
+
+
+@pytest.fixture(name="mock_validate")
+def mock_validate_fixture(monkeypatch):
+    """
+    Replace the SBD validation layer, by default returning no validation errors
+    """
+    mock_validate = mock.Mock(return_value={})
+    monkeypatch.setattr("ska_oso_services.odt.api.sbds.validate_sbd", mock_validate)
+    return mock_validate
 
 
 class TestSBDefinitionAPI:
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    def test_sbds_create(self, mock_uow, client):
+    def test_sbds_create(self, mock_oda, client):
         """
         Confirm that a call to /sbd/create
          - returns an empty SBD with an SBD ID and valid metadata
@@ -38,32 +63,25 @@ class TestSBDefinitionAPI:
         assert result["interface"] == "https://schema.skao.int/ska-oso-pdm-sbd/0.1"
 
         # No ODA interactions expected for a create operation
-        mock_uow.add.assert_not_called()
-        mock_uow.get.assert_not_called()
+        mock_oda.assert_not_called()
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    def test_sbds_get_existing_sbd(self, mock_uow, client):
+    def test_sbds_get_existing_sbd(self, uow_mock, client):
         """
         Check the sbds_get method returns the expected SBD and status code
         """
-        uow_mock = mock.MagicMock()
         test_sbd = TestDataFactory.sbdefinition()
         uow_mock.sbds.get.return_value = test_sbd
-        mock_uow().__enter__.return_value = uow_mock
 
         response = client.get(f"{SBDS_API_URL}/sbd-1234")
 
-        assert_json_is_equal(response.text, test_sbd.model_dump_json())
+        assert_json_is_equal(response.content, VALID_MID_SBDEFINITION_JSON)
         assert response.status_code == HTTPStatus.OK
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    def test_sbds_get_not_found_sbd(self, mock_uow, client):
+    def test_sbds_get_not_found_sbd(self, uow_mock, client):
         """
         Check the sbds_get method returns the Not Found error when identifier not in ODA
         """
-        uow_mock = mock.MagicMock()
         uow_mock.sbds.get.side_effect = KeyError("could not be found")
-        mock_uow().__enter__.return_value = uow_mock
 
         response = client.get(f"{SBDS_API_URL}/sbd-1234")
 
@@ -72,15 +90,12 @@ class TestSBDefinitionAPI:
         }
         assert response.status_code == HTTPStatus.NOT_FOUND
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    def test_sbds_get_error(self, mock_uow, client):
+    def test_sbds_get_error(self, uow_mock, client):
         """
         Check the sbds_get method returns a formatted error
         when ODA responds with an error
         """
-        uow_mock = mock.MagicMock()
         uow_mock.sbds.get.side_effect = ValueError("test", "error")
-        mock_uow().__enter__.return_value = uow_mock
 
         with pytest.raises(ValueError):
             response = client.get(f"{SBDS_API_URL}/sbd-1234")
@@ -91,23 +106,20 @@ class TestSBDefinitionAPI:
             assert detail["message"] == "ValueError('test', 'error')"
             assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
     def test_validate_valid_sbd(self, mock_validate, client):
         """
         Check the sbds_validate handles a valid return value from the
         validation layer and creates the correct response
         """
-        mock_validate.return_value = {}
         response = client.post(
             f"{SBDS_API_URL}/validate",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.json() == {"valid": True, "messages": {}}
         assert response.status_code == HTTPStatus.OK
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
     def test_validate_invalid_sbd(self, mock_validate, client):
         """
         Check the sbds_validate handles a valid return value from the
@@ -119,8 +131,8 @@ class TestSBDefinitionAPI:
 
         response = client.post(
             f"{SBDS_API_URL}/validate",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
         assert response.status_code == HTTPStatus.OK
         expected = ValidationResponse(
@@ -128,40 +140,33 @@ class TestSBDefinitionAPI:
         )
         assert response.json() == expected.model_dump(mode="json")
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_post_success(self, mock_validate, mock_uow, client):
+    def test_sbds_post_success(self, mock_validate, uow_mock, client):
         """
         Check the sbds_post method returns the expected response
         """
-        mock_validate.return_value = {}
-        uow_mock = mock.MagicMock()
         test_sbd = TestDataFactory.sbdefinition()
         uow_mock.sbds.add.return_value = test_sbd
         uow_mock.sbds.get.return_value = test_sbd
-        mock_uow().__enter__.return_value = uow_mock
 
         response = client.post(
             f"{SBDS_API_URL}",
-            data=SBDEFINITION_WITHOUT_ID_JSON,
-            headers={"Content-type": "application/json"},
+            content=SBDEFINITION_WITHOUT_ID_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == HTTPStatus.OK
-        assert_json_is_equal(response.text, test_sbd.model_dump_json())
+        assert_json_is_equal(response.content, VALID_MID_SBDEFINITION_JSON)
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_post_given_sbd_id_raises_error(self, mock_validate, client):
+    def test_sbds_post_given_sbd_id_raises_error(self, mock_validate, mock_oda, client):
         """
         Check the sbds_post method returns a validation error if the user
         gives an sbd_id in the body, as we don't want to just silently overwrite this
         """
-        mock_validate.return_value = {}
 
         response = client.post(
             f"{SBDS_API_URL}",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == HTTPStatus.BAD_REQUEST
@@ -172,85 +177,70 @@ class TestSBDefinitionAPI:
                 " them from SKUID, so they should not be given in this request."
             )
         }
+        # The request is rejected before the ODA is used
+        mock_oda.assert_not_called()
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_post_value_error(self, mock_validate, client):
+    @SBDS_WRITE_REQUESTS
+    def test_sbds_validation_error(self, mock_validate, client, method, url, body):
         """
-        Check the sbds_post method returns the validation error in a response
+        Check the sbds_post and sbds_put methods return the validation error
+        in a response
         """
-        mock_validate.return_value = {"validation_errors": "some validation error"}
+        mock_validate.return_value = VALIDATION_ERRORS
 
-        response = client.post(
-            f"{SBDS_API_URL}",
-            data=SBDEFINITION_WITHOUT_ID_JSON,
-            headers={"Content-type": "application/json"},
-        )
+        response = client.request(method, url, content=body, headers=JSON_HEADERS)
 
-        assert response.json() == {
-            "detail": {
-                "valid": False,
-                "messages": {"validation_errors": "some validation error"},
-            }
-        }
+        assert response.json() == VALIDATION_FAILED_RESPONSE
         assert response.status_code == HTTPStatus.BAD_REQUEST
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_post_oda_error(self, mock_validate, mock_uow, client):
+    @SBDS_WRITE_REQUESTS
+    def test_sbds_oda_error(self, mock_validate, uow_mock, client, method, url, body):
         """
-        Check the sbds_post method returns the expected error response
-        from an error in the ODA
+        Check the sbds_post and sbds_put methods return the expected error
+        response from an error in the ODA
         """
-        mock_validate.return_value = {}
-        uow_mock = mock.MagicMock()
+        uow_mock.sbds.__contains__.return_value = True
         uow_mock.sbds.add.side_effect = IOError("test error")
-        mock_uow().__enter__.return_value = uow_mock
 
         with pytest.raises(IOError):
-            response = client.post(
-                f"{SBDS_API_URL}",
-                data=SBDEFINITION_WITHOUT_ID_JSON,
-                headers={"Content-type": "application/json"},
+            response = client.request(
+                method,
+                url,
+                content=body,
+                headers=JSON_HEADERS,
             )
 
             assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
             assert response.json() == {"detail": "OSError('test error')"}
 
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_put_success(self, mock_validate, mock_uow, client):
+    def test_sbds_put_success(self, mock_validate, uow_mock, client):
         """
         Check the sbds_put method returns the expected response
         """
-        mock_validate.return_value = {}
-        uow_mock = mock.MagicMock()
         uow_mock.sbds.__contains__.return_value = True
         test_sbd = TestDataFactory.sbdefinition()
         uow_mock.sbds.add.return_value = test_sbd
         uow_mock.sbds.get.return_value = test_sbd
-        mock_uow().__enter__.return_value = uow_mock
 
         response = client.put(
-            f"{SBDS_API_URL}/sbd-mvp01-20200325-00001",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            SBD_API_URL,
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == HTTPStatus.OK
-        assert_json_is_equal(response.text, test_sbd.model_dump_json())
+        assert_json_is_equal(response.content, VALID_MID_SBDEFINITION_JSON)
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_put_wrong_identifier(self, mock_validate, client):
+    def test_sbds_put_wrong_identifier(self, mock_validate, mock_oda, client):
         """
         Check the sbds_put method returns the expected error response
         when the identifier in the path doesn't match the sbd_id in the SBDefinition
         """
-        mock_validate.return_value = {}
 
         response = client.put(
             f"{SBDS_API_URL}/00000",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -260,70 +250,22 @@ class TestSBDefinitionAPI:
                 "ID for the endpoint and the JSON payload"
             )
         }
+        mock_oda.assert_not_called()
 
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_put_value_error(self, mock_validate, client):
-        """
-        Check the sbds_put method returns the validation error in a response
-        """
-        mock_validate.return_value = {"validation_errors": "some validation error"}
-
-        response = client.put(
-            f"{SBDS_API_URL}/sbd-mvp01-20200325-00001",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
-        )
-
-        assert response.status_code == HTTPStatus.BAD_REQUEST
-        assert response.json() == {
-            "detail": {
-                "valid": False,
-                "messages": {"validation_errors": "some validation error"},
-            }
-        }
-
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_put_not_found(self, mock_validate, mock_uow, client):
+    def test_sbds_put_not_found(self, mock_validate, uow_mock, client):
         """
         Check the sbds_put method returns the expected error response
         when the identifier is not found in the ODA.
         """
-        mock_validate.return_value = {}
-        uow_mock = mock.MagicMock()
         uow_mock.sbds.__contains__.return_value = False
-        mock_uow().__enter__.return_value = uow_mock
 
         response = client.put(
-            f"{SBDS_API_URL}/sbd-mvp01-20200325-00001",
-            data=VALID_MID_SBDEFINITION_JSON,
-            headers={"Content-type": "application/json"},
+            SBD_API_URL,
+            content=VALID_MID_SBDEFINITION_JSON,
+            headers=JSON_HEADERS,
         )
 
         assert response.status_code == HTTPStatus.NOT_FOUND
         assert response.json() == {
-            "detail": "Identifier sbd-mvp01-20200325-00001 not found in repository"
+            "detail": f"Identifier {SBD_ID} not found in repository"
         }
-
-    @mock.patch("ska_oso_services.odt.api.sbds.oda.uow")
-    @mock.patch("ska_oso_services.odt.api.sbds.validate_sbd")
-    def test_sbds_put_oda_error(self, mock_validate, mock_uow, client):
-        """
-        Check the sbds_put method returns the expected error response
-        from an error in the ODA
-        """
-        mock_validate.return_value = {}
-        uow_mock = mock.MagicMock()
-        uow_mock.sbds.__contains__.return_value = True
-        uow_mock.sbds.add.side_effect = IOError("test error")
-        mock_uow().__enter__.return_value = uow_mock
-
-        with pytest.raises(IOError):
-            response = client.put(
-                f"{SBDS_API_URL}/sbd-mvp01-20200325-00001",
-                data=VALID_MID_SBDEFINITION_JSON,
-                headers={"Content-type": "application/json"},
-            )
-
-            assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
-            assert response.json() == {"detail": "OSError('test error')"}
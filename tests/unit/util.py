@@ -2,11 +2,13 @@
 Utility functions to be used in tests
 """
 
+import functools
 import json
 import os.path
 from datetime import datetime
+from typing import Callable
+from unittest import mock
 
-from deepdiff import DeepDiff
 from ska_db_oda.persistence.domain import set_identifier
 from ska_oso_pdm.builders import low_imaging_sb, mid_imaging_sb
 from ska_oso_pdm.project import Project
@@ -15,7 +17,7 @@ from ska_oso_pdm.sb_definition import SBDefinition, SBDefinitionID
 
 def assert_json_is_equal(json_a, json_b, exclude_paths=None):
     """
-    Utility function to compare two JSON objects
+    Utility function to compare two JSON documents, given as str or bytes
     """
     # key/values in the generated JSON do not necessarily have the same order
     # as the test string, even though they are equivalent JSON objects, e.g.,
@@ -26,11 +28,24 @@ def assert_json_is_equal(json_a, json_b, exclude_paths=None):
     try:
         assert obj_a == obj_b
     except AssertionError:
-        # raise a more useful exception that shows *where* the JSON differs
+        # raise a more useful exception that shows *where* the JSON differs.
+        # DeepDiff is only needed here, so it is imported only when required
+        from deepdiff import DeepDiff
+
         diff = DeepDiff(obj_a, obj_b, ignore_order=True, exclude_paths=exclude_paths)
         assert {} == diff, f"JSON not equal: {diff}"
 
 
+def bind_uow(mock_oda: mock.MagicMock) -> mock.MagicMock:
+    """
+    Utility function to wire a UnitOfWork mock into a mocked oda.uow, so that
+    `with oda.uow() as uow:` in the API code yields the returned mock
+    """
+    uow_mock = mock.MagicMock()
+    mock_oda.return_value.__enter__.return_value = uow_mock
+    return uow_mock
+
+
 def load_string_from_file(filename):
     """
     Return a file from the current directory as a string
@@ -42,6 +57,9 @@ def load_string_from_file(filename):
         return json_data
 
 
+SAMPLE_PROJECT_JSON = load_string_from_file("files/testfile_sample_project.json")
+
+
 class TestDataFactory:
     @staticmethod
     def sbdefinition(
@@ -52,17 +70,9 @@ class TestDataFactory:
         ),
         without_metadata: bool = False,
     ) -> SBDefinition:
-        sbd = mid_imaging_sb()
-        set_identifier(sbd, sbd_id)
-
-        if without_metadata:
-            sbd.metadata = None
-            return sbd
-
-        sbd.metadata.version = version
-        sbd.metadata.created_on = created_on
-
-        return sbd
+        return TestDataFactory._sbdefinition(
+            mid_imaging_sb, sbd_id, version, created_on, without_metadata
+        ).model_copy(deep=True)
 
     @staticmethod
     def lowsbdefinition(
@@ -73,7 +83,22 @@ class TestDataFactory:
         ),
         without_metadata: bool = False,
     ) -> SBDefinition:
-        sbd = low_imaging_sb()
+        return TestDataFactory._sbdefinition(
+            low_imaging_sb, sbd_id, version, created_on, without_metadata
+        ).model_copy(deep=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _sbdefinition(
+        builder: Callable[[], SBDefinition],
+        sbd_id: SBDefinitionID,
+        version: int,
+        created_on: datetime,
+        without_metadata: bool,
+    ) -> SBDefinition:
+        # Building a full SBDefinition is relatively expensive, so each one is
+        # only built once and the public factories hand out deep copies
+        sbd = builder()
         set_identifier(sbd, sbd_id)
 
         if without_metadata:
@@ -90,9 +115,14 @@ class TestDataFactory:
         prj_id: str = "prj-mvp01-20220923-00001",
         version: int = 1,
     ) -> Project:
-        prj = Project.model_validate_json(
-            load_string_from_file("files/testfile_sample_project.json")
-        )
+        # Parsing the sample file is the expensive part, so build each Project
+        # once and hand out deep copies that tests are free to mutate
+        return TestDataFactory._project(prj_id, version).model_copy(deep=True)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _project(prj_id: str, version: int) -> Project:
+        prj = Project.model_validate_json(SAMPLE_PROJECT_JSON)
 
         set_identifier(prj, prj_id)
         prj.metadata.version = version
@@ -100,13 +130,22 @@ class TestDataFactory:
         return prj
 
 
-VALID_MID_SBDEFINITION_JSON = TestDataFactory.sbdefinition().model_dump_json()
-VALID_LOW_SBDEFINITION_JSON = TestDataFactory.lowsbdefinition().model_dump_json()
-SBDEFINITION_WITHOUT_ID_JSON = TestDataFactory.sbdefinition(
-    sbd_id=None
-).model_dump_json()
-SBDEFINITION_WITHOUT_ID_OR_METADATA_JSON = TestDataFactory.sbdefinition(
-    sbd_id=None, without_metadata=True
-).model_dump_json()
-
-VALID_PROJECT_WITHOUT_JSON = TestDataFactory.project(prj_id=None).model_dump_json()
+# The JSON payloads are encoded once here, so tests can send them as
+# request bodies without re-encoding them for every request
+VALID_MID_SBDEFINITION_JSON = TestDataFactory.sbdefinition().model_dump_json().encode()
+VALID_LOW_SBDEFINITION_JSON = (
+    TestDataFactory.lowsbdefinition().model_dump_json().encode()
+)
+SBDEFINITION_WITHOUT_ID_JSON = (
+    TestDataFactory.sbdefinition(sbd_id=None).model_dump_json().encode()
+)
+SBDEFINITION_WITHOUT_ID_OR_METADATA_JSON = (
+    TestDataFactory.sbdefinition(sbd_id=None, without_metadata=True)
+    .model_dump_json()
+    .encode()
+)
+
+VALID_PROJECT_JSON = TestDataFactory.project().model_dump_json().encode()
+VALID_PROJECT_WITHOUT_JSON = (
+    TestDataFactory.project(prj_id=None).model_dump_json().encode()
+)